@@ -1,3 +1,9 @@
+import os
+
+# SDL reads hints from the environment on init; set them before pygame loads.
+os.environ.setdefault("SDL_RENDER_BATCHING", "1")
+os.environ.setdefault("SDL_FRAMEBUFFER_ACCELERATION", "1")
+
 from pong.app import run
 from pong.logging_config import configure_logging, mode_from_env
 
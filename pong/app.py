@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import pygame
 
@@ -14,7 +15,7 @@ from pong.core.input import InputState, Action, build_keymap_from_actions, defau
 from pong.core.debug import DebugOverlay, DebugOverlayConfig
 from pong.skin import SkinRegistry
 from pathlib import Path
-from pong.ui.widgets import ThemeTokens, ButtonStyle
+from pong.ui.widgets import ThemeTokens, ButtonStyle, sysfont
 from pong.data_io import load_json, save_json
 
 
@@ -44,11 +45,12 @@ class GameApp:
         self.disp = self.settings.display
         self.screen = self._init_display(self.disp.width, self.disp.height, self.disp.title)
         self.clock = Clock()
+        self._fps = self.disp.fps
         self.running = True
 
-        self.font_big = pygame.font.SysFont("consolas", 48, bold=True)
-        self.font = pygame.font.SysFont("consolas", 34, bold=True)
-        self.font_small = pygame.font.SysFont("consolas", 24)
+        self.font_big = sysfont("consolas", 48, bold=True)
+        self.font = sysfont("consolas", 34, bold=True)
+        self.font_small = sysfont("consolas", 24)
 
         # game state flag
         self.in_game = False
@@ -60,6 +62,8 @@ class GameApp:
         self.credits = 0
         self.owned_items: dict[str, set[str]] = {}
 
+        # decoded skin images keyed by (path, alpha, size); cycling back to a skin reuses them
+        self._images: dict[tuple[str, bool, tuple[int, int] | None], pygame.Surface] = {}
         self.skins = SkinRegistry(Path("skins"))
         self._skin_names = self.skins.list()
         self._skin_index = 0
@@ -167,57 +171,97 @@ class GameApp:
         return build_keymap_from_actions(actions)
 
     def save_input_cfg(self, action_keys: dict[str, int]) -> None:
+        # rebinding a key to the action it already has changes nothing on disk
+        if action_keys == self.input_cfg:
+            return
         self.input_cfg = action_keys
         save_json("data/input_bindings.json", action_keys)
 
     def save_display_cfg(self) -> None:
         pass
 
+    # debug hotkeys ----------------------------------------------------- #
+    def _refresh_skins(self) -> None:
+        self.skins.refresh()
+        self._images.clear()
+        self._skin_names = self.skins.list()
+        self.manager.app_ctx["skin_names"] = self._skin_names
+        self.log.info("Skins refreshed", extra={"count": len(self._skin_names)})
+
+    def _cycle_skin(self) -> None:
+        if not self._skin_names:
+            return
+        self._skin_index = (self._skin_index + 1) % len(self._skin_names)
+        self._apply_skin(self._skin_names[self._skin_index])
+        self.log.info("Skin cycled", extra={"skin": self._skin_names[self._skin_index]})
+
+    def _cycle_ball_skin(self, step: int) -> None:
+        if not self.ball_skins:
+            return
+        self.ball_skin_index = (self.ball_skin_index + step) % len(self.ball_skins)
+        self._apply_ball_skin(self.ball_skin_index)
+        self.log.info("Ball skin cycled", extra={"ball_skin": self.ball_skins[self.ball_skin_index]})
+
+    def _cycle_paddle_skin(self) -> None:
+        if not self.paddle_skins:
+            return
+        self.paddle_skin_index = (self.paddle_skin_index + 1) % len(self.paddle_skins)
+        self._apply_paddle_skin(self.paddle_skin_index)
+        self.log.info("Paddle skin cycled", extra={"paddle_skin": self.paddle_skins[self.paddle_skin_index]})
+
     def run(self) -> None:
         self.log.info("Entering main loop")
+        QUIT, KEYDOWN, KEYUP = pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP
+        process_event = self.input.process_event
+        handle_event = self.manager.handle_event
+        # debug hotkeys: one dict lookup per KEYDOWN instead of an if/elif chain
+        hotkeys = {
+            pygame.K_F5: self._refresh_skins,
+            pygame.K_F6: self._cycle_skin,
+            pygame.K_F7: functools.partial(self._cycle_ball_skin, 1),
+            pygame.K_F8: functools.partial(self._cycle_ball_skin, -1),
+            pygame.K_F9: self._cycle_paddle_skin,
+        }
+        # per-frame debug logs are skipped outright unless DEBUG is enabled
+        debug = self.log.isEnabledFor(logging.DEBUG)
+        # rendering is skipped while the window is minimized/hidden; updates keep running
+        visibility = {
+            pygame.WINDOWMINIMIZED: False,
+            pygame.WINDOWHIDDEN: False,
+            pygame.WINDOWRESTORED: True,
+            pygame.WINDOWSHOWN: True,
+        }
+        visible = True
         while self.running:
-            self.clock.tick(self.disp.fps)
-            self.log.debug("Frame tick", extra={"fps": self.clock.fps, "scene": self.manager.current_name})
+            self.clock.tick(self._fps)
+            if debug:
+                self.log.debug("Frame tick", extra={"fps": self.clock.fps, "scene": self.manager.current_name})
 
             events = pygame.event.get()
             for event in events:
-                if event.type == pygame.QUIT:
+                etype = event.type
+                if etype == QUIT:
                     self.running = False
                     self.log.info("Quit event received")
                 else:
-                    self.input.process_event(event)
-                    self.manager.handle_event(event)
-                    if event.type == pygame.KEYDOWN:
+                    process_event(event)
+                    handle_event(event)
+                    if etype == KEYDOWN:
                         self.bus.publish(KeyAction(key=event.key, action="down", mods=event.mod))
-                        if event.key == pygame.K_F5:
-                            self.skins.refresh()
-                            self._skin_names = self.skins.list()
-                            self.manager.app_ctx["skin_names"] = self._skin_names
-                            self.log.info("Skins refreshed", extra={"count": len(self._skin_names)})
-                        elif event.key == pygame.K_F6 and self._skin_names:
-                            self._skin_index = (self._skin_index + 1) % len(self._skin_names)
-                            self._apply_skin(self._skin_names[self._skin_index])
-                            self.log.info("Skin cycled", extra={"skin": self._skin_names[self._skin_index]})
-                        elif event.key == pygame.K_F7 and self.ball_skins:
-                            self.ball_skin_index = (self.ball_skin_index + 1) % len(self.ball_skins)
-                            self._apply_ball_skin(self.ball_skin_index)
-                            self.log.info("Ball skin cycled", extra={"ball_skin": self.ball_skins[self.ball_skin_index]})
-                        elif event.key == pygame.K_F8 and self.ball_skins:
-                            self.ball_skin_index = (self.ball_skin_index - 1) % len(self.ball_skins)
-                            self._apply_ball_skin(self.ball_skin_index)
-                            self.log.info("Ball skin cycled", extra={"ball_skin": self.ball_skins[self.ball_skin_index]})
-                        elif event.key == pygame.K_F9 and self.paddle_skins:
-                            self.paddle_skin_index = (self.paddle_skin_index + 1) % len(self.paddle_skins)
-                            self._apply_paddle_skin(self.paddle_skin_index)
-                            self.log.info("Paddle skin cycled", extra={"paddle_skin": self.paddle_skins[self.paddle_skin_index]})
-                    elif event.type == pygame.KEYUP:
+                        hotkey = hotkeys.get(event.key)
+                        if hotkey:
+                            hotkey()
+                    elif etype == KEYUP:
                         self.bus.publish(KeyAction(key=event.key, action="up", mods=event.mod))
+                    elif etype in visibility:
+                        visible = visibility[etype]
 
             # global actions
             pressed_back = self.input.consume(Action.BACK)
             pressed_pause = self.input.consume(Action.PAUSE)
             current = self.manager.current_name
-            self.log.debug("Input processed", extra={"back": pressed_back, "pause": pressed_pause, "scene": current})
+            if debug:
+                self.log.debug("Input processed", extra={"back": pressed_back, "pause": pressed_pause, "scene": current})
 
             if current == "pause":
                 if pressed_pause or pressed_back:
@@ -260,10 +304,17 @@ class GameApp:
                 self.manager.update(fixed_dt)
                 self.transitions.update(fixed_dt)
 
+            if not visible:
+                continue
+
             # Render pass
             self.manager.draw(self.screen)
             self.transitions.draw_overlay(self.screen)
             self.debug_overlay.draw(self.screen)
+            # Every scene repaints the whole backbuffer (fill/background blit) and
+            # the fade overlay covers the full window, so the dirty region is the
+            # entire screen each frame; update(rect_list) would only add per-rect
+            # overhead on top of the same full-window present.
             pygame.display.flip()
 
         self.log.info("Main loop exited")
@@ -376,7 +427,7 @@ class GameApp:
         idx = index % len(self.ball_skins)
         path = self.ball_skins[idx]
         try:
-            surf = pygame.image.load(path).convert_alpha()
+            surf = self._load_image(path)
             self.manager.app_ctx["ball_image"] = surf
             self.ball_skin_index = idx
             self.manager.app_ctx["ball_skin_name"] = path
@@ -390,7 +441,7 @@ class GameApp:
         idx = index % len(self.paddle_skins)
         path = self.paddle_skins[idx]
         try:
-            surf = pygame.image.load(path).convert_alpha()
+            surf = self._load_image(path)
             self.manager.app_ctx["paddle_image"] = surf
             self.paddle_skin_index = idx
             self.manager.app_ctx["paddle_skin_name"] = path
@@ -450,13 +501,24 @@ class GameApp:
             radius=12,
         )
 
+    def _load_image(self, path: str, alpha: bool = True, size: tuple[int, int] | None = None) -> pygame.Surface:
+        """Load (and optionally scale) an image once; raises like pygame.image.load."""
+        key = (path, alpha, size)
+        surf = self._images.get(key)
+        if surf is None:
+            surf = pygame.image.load(path)
+            surf = surf.convert_alpha() if alpha else surf.convert()
+            if size is not None:
+                surf = pygame.transform.scale(surf, size)
+            self._images[key] = surf
+        return surf
+
     def _load_skin_assets(self, manifest) -> None:
         bg_image = None
         path = manifest.assets.get("bg") if hasattr(manifest, "assets") else None
         if path:
             try:
-                surf = pygame.image.load(path).convert()
-                bg_image = pygame.transform.scale(surf, (self.disp.width, self.disp.height))
+                bg_image = self._load_image(path, alpha=False, size=(self.disp.width, self.disp.height))
             except Exception as exc:
                 self.log.warning("Failed to load background image", extra={"path": path, "error": str(exc)})
                 bg_image = None
@@ -466,7 +528,7 @@ class GameApp:
         ball_path = manifest.assets.get("ball") if hasattr(manifest, "assets") else None
         if ball_path:
             try:
-                ball_img = pygame.image.load(ball_path).convert_alpha()
+                ball_img = self._load_image(ball_path)
             except Exception as exc:
                 self.log.warning("Failed to load ball image", extra={"path": ball_path, "error": str(exc)})
                 ball_img = None
@@ -476,12 +538,13 @@ class GameApp:
         paddle_path = manifest.assets.get("paddle") if hasattr(manifest, "assets") else None
         if paddle_path:
             try:
-                paddle_img = pygame.image.load(paddle_path).convert_alpha()
+                paddle_img = self._load_image(paddle_path)
             except Exception as exc:
                 self.log.warning("Failed to load paddle image", extra={"path": paddle_path, "error": str(exc)})
                 paddle_img = None
         self.manager.app_ctx["paddle_image"] = paddle_img
 
+
 def _hex_to_rgb(hexstr: str) -> tuple[int, int, int]:
     hs = hexstr.lstrip("#")
     if len(hs) == 3:
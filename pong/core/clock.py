@@ -19,11 +19,13 @@ class Clock:
         self.render_dt = 0.0
         self.alpha = 0.0
         self._pygame_clock = pygame.time.Clock()
+        self._max_frame_time = self.timestep.max_frame_time
 
     def tick(self, target_fps: int) -> None:
         # measure frame time
-        frame_dt = self._pygame_clock.tick(target_fps) / 1000.0
-        frame_dt = min(frame_dt, self.timestep.max_frame_time)
+        frame_dt = self._pygame_clock.tick(target_fps) * 0.001
+        if frame_dt > self._max_frame_time:
+            frame_dt = self._max_frame_time
         self._accumulator += frame_dt
         self.render_dt = frame_dt
 
@@ -4,6 +4,8 @@ import pygame
 from dataclasses import dataclass
 from typing import Callable
 
+from pong.ui.widgets import sysfont
+
 
 @dataclass
 class DebugOverlayConfig:
@@ -19,6 +21,9 @@ class DebugOverlay:
         self.config = config or DebugOverlayConfig()
         self.font: pygame.font.Font | None = None
         self.lines_provider: Callable[[], list[str]] | None = None
+        # (text, surface) per line; only lines whose text changed are re-rendered
+        self._line_surfs: list[tuple[str, pygame.Surface]] = []
+        self._bg: pygame.Surface | None = None
 
     def set_provider(self, provider: Callable[[], list[str]]) -> None:
         self.lines_provider = provider
@@ -27,18 +32,34 @@ class DebugOverlay:
         if not self.config.show or not self.lines_provider:
             return
         if self.font is None:
-            self.font = pygame.font.SysFont("consolas", self.config.font_size)
+            self.font = sysfont("consolas", self.config.font_size)
         lines = self.lines_provider()
         if not lines:
             return
+        text_surfs = self._render_lines(lines)
         pad = self.config.padding
-        text_surfs = [self.font.render(line, True, self.config.fg) for line in lines]
         width = max(s.get_width() for s in text_surfs) + pad * 2
         height = sum(s.get_height() for s in text_surfs) + pad * 2 + (len(text_surfs) - 1) * 2
-        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
-        overlay.fill(self.config.bg)
-        y = pad
+        bg = self._bg
+        if bg is None or bg.get_size() != (width, height):
+            # opaque fill + surface alpha blends like the RGBA fill, without per-pixel alpha
+            bg = pygame.Surface((width, height))
+            bg.fill(self.config.bg[:3])
+            bg.set_alpha(self.config.bg[3])
+            self._bg = bg
+        blits = [(bg, (pad, pad))]
+        y = pad * 2
         for surf in text_surfs:
-            overlay.blit(surf, (pad, y))
+            blits.append((surf, (pad * 2, y)))
             y += surf.get_height() + 2
-        screen.blit(overlay, (pad, pad))
+        screen.blits(blits, doreturn=False)
+
+    def _render_lines(self, lines: list[str]) -> list[pygame.Surface]:
+        cache = self._line_surfs
+        for i, line in enumerate(lines):
+            if i == len(cache):
+                cache.append((line, self.font.render(line, True, self.config.fg)))
+            elif cache[i][0] != line:
+                cache[i] = (line, self.font.render(line, True, self.config.fg))
+        del cache[len(lines):]
+        return [surf for _, surf in cache]
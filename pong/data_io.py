@@ -1,4 +1,7 @@
-"""Tiny JSON helper for loading/saving local data files with defaults."""
+"""Tiny JSON helper for loading/saving local data files with defaults.
+
+Uses orjson when it is installed and falls back to the stdlib json module.
+"""
 
 from __future__ import annotations
 
@@ -7,6 +10,11 @@ import os
 from typing import Any
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,10 +23,14 @@ def load_json(path: str, default: Any) -> Any:
         logger.debug("load_json missing file, returning default", extra={"path": path})
         return default
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            logger.debug("load_json success", extra={"path": path})
-            return data
+        if orjson is not None:
+            with open(path, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        logger.debug("load_json success", extra={"path": path})
+        return data
     except Exception as exc:
         logger.warning("load_json failed, returning default", extra={"path": path, "error": str(exc)})
         return default
@@ -26,6 +38,10 @@ def load_json(path: str, default: Any) -> Any:
 
 def save_json(path: str, data: Any) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
     logger.debug("save_json wrote file", extra={"path": path})
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pygame
 from pong.effects.base import EffectBase, EffectContext
-from pong.events import BallBouncePaddle
+from pong.events import BallBouncePaddle, ShieldLog
 
 
 class Effect(EffectBase):
@@ -14,6 +14,7 @@ class Effect(EffectBase):
         self.active = False
         self.color = (120, 200, 255)
         self.alpha = 160
+        self._overlay: pygame.Surface | None = None
 
     def can_activate(self, ctx: EffectContext) -> bool:
         return not self.active
@@ -24,9 +25,6 @@ class Effect(EffectBase):
         ctx.logger.info("Shield active", extra={"duration": self.time_left})
         # explicit log event name for visibility
         if ctx.bus:
-            from pong.events import GameEvent
-            class ShieldLog(GameEvent):
-                def __init__(self, msg): self.msg = msg
             ctx.bus.publish(ShieldLog(f"Shield activated ({self.time_left:.1f}s)"))
 
     def on_event(self, ctx: EffectContext, event) -> None:
@@ -51,10 +49,15 @@ class Effect(EffectBase):
             return
         margin = ctx.play_scene.margin
         h = ctx.play_scene.height
-        rect = pygame.Rect(0, 0, margin + 6, h)
-        surf = pygame.Surface(rect.size, pygame.SRCALPHA)
-        surf.fill((*self.color, self.alpha))
-        screen.blit(surf, rect)
+        size = (margin + 6, h)
+        surf = self._overlay
+        if surf is None or surf.get_size() != size:
+            # arena effects may change margin/height; rebuild only then
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            surf.fill((*self.color, self.alpha))
+            surf = surf.convert_alpha()
+            self._overlay = surf
+        screen.blit(surf, (0, 0))
 
 
 effect = Effect()
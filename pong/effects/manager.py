@@ -60,6 +60,8 @@ class EffectManager:
             self.activate(eid)
 
     def on_tick(self, dt: float) -> None:
+        if not self.active:
+            return
         for eff in list(self.active.values()):
             try:
                 eff.on_tick(self.ctx, dt)
@@ -67,6 +69,8 @@ class EffectManager:
                 self.log.exception("Effect tick failed", extra={"id": eff.id, "error": str(exc)})
 
     def on_event(self, event) -> None:
+        if not self.active:
+            return
         for eff in list(self.active.values()):
             try:
                 eff.on_event(self.ctx, event)
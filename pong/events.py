@@ -6,33 +6,35 @@ without changing the core game loop.
 
 from __future__ import annotations
 
-from collections import defaultdict
+import logging
 from dataclasses import dataclass
-from typing import Any, Callable, DefaultDict, Generic, TypeVar, Optional
+from typing import Any, Callable, Dict, Generic, TypeVar, Optional
 
 
 class GameEvent:
     """Base class for all domain events."""
 
+    __slots__ = ()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class BallHitPaddle(GameEvent):
     paddle_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PointScored(GameEvent):
     scorer_id: str  # "left" or "right"
     left_score: int
     right_score: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoundReset(GameEvent):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SettingsChangeRequested(GameEvent):
     """Ask the game to patch runtime settings."""
 
@@ -40,7 +42,7 @@ class SettingsChangeRequested(GameEvent):
     values: dict[str, object]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SettingsChanged(GameEvent):
     """Broadcast after settings were applied."""
 
@@ -48,7 +50,7 @@ class SettingsChanged(GameEvent):
     values: dict[str, object]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpawnBallRequested(GameEvent):
     """Ask the game to spawn more balls."""
 
@@ -57,24 +59,24 @@ class SpawnBallRequested(GameEvent):
     size: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BallSpawned(GameEvent):
     ball_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BallRemoved(GameEvent):
     ball_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KeyAction(GameEvent):
     key: int
     action: str  # "down" | "up"
     mods: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BallBouncePaddle(GameEvent):
     ball_id: str
     paddle_id: str
@@ -86,7 +88,7 @@ class BallBouncePaddle(GameEvent):
     angle_deg: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BallBounceWall(GameEvent):
     ball_id: str
     wall: str  # "top" | "bottom" | "left" | "right"
@@ -97,13 +99,13 @@ class BallBounceWall(GameEvent):
     angle_deg: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SceneChanged(GameEvent):
     previous: str | None
     current: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolutionChanged(GameEvent):
     width: int
     height: int
@@ -111,42 +113,73 @@ class ResolutionChanged(GameEvent):
     prev_height: int
 
 
+@dataclass(frozen=True, slots=True)
+class ShieldLog(GameEvent):
+    """Status message published by the shield boost."""
+
+    msg: str
+
+
+def _event_payload(event: GameEvent) -> dict[str, Any]:
+    fields = getattr(event, "__dataclass_fields__", None)
+    if fields is not None:
+        return {name: getattr(event, name) for name in fields}
+    return dict(getattr(event, "__dict__", {}))
+
+
 EventType = TypeVar("EventType", bound=GameEvent)
 Listener = Callable[[GameEvent], None]
 
 
 class EventBus(Generic[EventType]):
     def __init__(self) -> None:
-        self._listeners: DefaultDict[type[GameEvent], list[tuple[Listener, Optional[Callable[[GameEvent], bool]]]]] = defaultdict(list)
-        import logging
+        # Listener tuples are replaced (copy-on-write) on subscribe/unsubscribe so
+        # publish can iterate them directly without copying per event.
+        self._listeners: Dict[type[GameEvent], tuple[tuple[Listener, Optional[Callable[[GameEvent], bool]]], ...]] = {}
         self._log = logging.getLogger(__name__)
         self.log_events = True
 
     def subscribe(self, event_cls: type[GameEvent], listener: Listener, predicate: Callable[[GameEvent], bool] | None = None) -> None:
-        self._listeners[event_cls].append((listener, predicate))
-        self._log.debug(
-            "Event subscribed",
-            extra={"event": event_cls.__name__, "listener": getattr(listener, "__name__", str(listener))},
-        )
+        self._listeners[event_cls] = self._listeners.get(event_cls, ()) + ((listener, predicate),)
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug(
+                "Event subscribed",
+                extra={"event": event_cls.__name__, "listener": getattr(listener, "__name__", str(listener))},
+            )
 
     def unsubscribe(self, event_cls: type[GameEvent], listener: Listener) -> None:
-        lst = self._listeners.get(event_cls, [])
-        self._listeners[event_cls] = [(l, p) for (l, p) in lst if l != listener]
+        lst = self._listeners.get(event_cls)
+        if lst is None:
+            return
+        remaining = tuple((l, p) for (l, p) in lst if l != listener)
+        if remaining:
+            self._listeners[event_cls] = remaining
+        else:
+            del self._listeners[event_cls]
 
     def emit(self, event: GameEvent) -> None:
         self.publish(event)
 
     def publish(self, event: GameEvent) -> None:
+        self._dispatch(event, self._listeners.get(GameEvent, ()))
+
+    def publish_batch(self, events: list[GameEvent]) -> None:
+        """Publish events in order, resolving the wildcard listeners once."""
+        wildcard = self._listeners.get(GameEvent, ())
+        for event in events:
+            self._dispatch(event, wildcard)
+
+    def _dispatch(self, event: GameEvent, wildcard: tuple) -> None:
         etype = type(event)
         if self.log_events:
-            payload = {**event.__dict__}
+            payload = _event_payload(event)
             self._log.info("Event %s %s", etype.__name__, payload, extra={"event": etype.__name__, "payload": payload})
         # direct listeners and wildcard (GameEvent)
-        listeners = list(self._listeners.get(etype, [])) + list(self._listeners.get(GameEvent, []))
-        for listener, predicate in listeners:
-            if predicate and not predicate(event):
-                continue
-            try:
-                listener(event)
-            except Exception as exc:  # keep game running
-                self._log.exception("Event handler error", extra={"event": etype.__name__, "listener": str(listener), "error": str(exc)})
+        for group in (self._listeners.get(etype, ()), wildcard):
+            for listener, predicate in group:
+                if predicate and not predicate(event):
+                    continue
+                try:
+                    listener(event)
+                except Exception as exc:  # keep game running
+                    self._log.exception("Event handler error", extra={"event": etype.__name__, "listener": str(listener), "error": str(exc)})
@@ -0,0 +1,48 @@
+"""Scalar physics helpers for the play scene.
+
+Plain float in/float out functions so the fixed-step collision code does not
+allocate pygame.Rect objects or touch scene state.
+"""
+
+from __future__ import annotations
+
+import math
+
+
+def aabb_overlap(ax: float, ay: float, aw: float, ah: float, bx: float, by: float, bw: float, bh: float) -> bool:
+    """Same result as ``pygame.Rect.colliderect`` for two non-empty boxes."""
+    return ax < bx + bw and ax + aw > bx and ay < by + bh and ay + ah > by
+
+
+def paddle_bounce(vx: float, vy: float, hit_pos: float, dir_x: int) -> tuple[float, float, float]:
+    """Outgoing velocity for a paddle hit; returns (vx, vy, speed).
+
+    hit_pos is -1..1 along the paddle, dir_x is +1 for the left paddle and -1
+    for the right one.
+    """
+    speed = max(320.0, (abs(vx) + abs(vy)) * 0.55)
+    new_vx = dir_x * speed
+    new_vy = hit_pos * speed * 0.75
+    # keep total speed consistent
+    mag = math.hypot(new_vx, new_vy)
+    target = max(340.0, mag)
+    new_vx = new_vx / mag * target
+    new_vy = new_vy / mag * target
+    # apply fixed deflection so bounce isn't perfectly mirrored
+    deflect = -10.0 if hit_pos < 0 else 10.0
+    new_vx, new_vy = offset_angle(new_vx, new_vy, deflect)
+    return new_vx, new_vy, target
+
+
+# (cos, sin) per deflection angle; callers only use a handful of fixed angles
+_ROTATIONS: dict[float, tuple[float, float]] = {}
+
+
+def offset_angle(vx: float, vy: float, deg: float) -> tuple[float, float]:
+    """Rotate velocity vector by deg while preserving speed."""
+    rot = _ROTATIONS.get(deg)
+    if rot is None:
+        rad = math.radians(deg)
+        rot = _ROTATIONS[deg] = (math.cos(rad), math.sin(rad))
+    c, s = rot
+    return vx * c - vy * s, vx * s + vy * c
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import Callable, Optional
 import pygame
 
+from pong.events import SceneChanged
 from .transitions import TransitionController, TransitionSpec
 
 
@@ -35,6 +36,10 @@ class Scene:
         raise NotImplementedError
 
 
+def _noop(*_args) -> None:
+    return
+
+
 @dataclass
 class _StackItem:
     name: str
@@ -49,10 +54,12 @@ class SceneManager:
         self._stack: list[_StackItem] = []
         self.scenes: dict[str, Scene] = {}
         self.log = logging.getLogger(__name__)
+        self._debug = self.log.isEnabledFor(logging.DEBUG)
         self.transitions: TransitionController | None = None
         # default spec provider can be overridden per call
         self.transition_spec_provider: Optional[Callable[[], TransitionSpec]] = None
         self.app = None  # set by GameApp
+        self._sync_top()
 
     def attach_transitions(self, controller: TransitionController, spec_provider: Callable[[], TransitionSpec]) -> None:
         self.transitions = controller
@@ -86,6 +93,7 @@ class SceneManager:
             return
         def apply_pop():
             popped = self._stack.pop()
+            self._sync_top()
             popped.scene.on_exit(payload)
             self.log.info("Scene pop", extra={"popped": popped.name})
             if self._stack:
@@ -101,7 +109,6 @@ class SceneManager:
         apply_pop()
 
     def _emit_scene_changed(self, previous: str | None, current: str | None) -> None:
-        from pong.events import SceneChanged, GameEvent
         if self.app and hasattr(self.app, "bus"):
             try:
                 self.app.bus.publish(SceneChanged(previous=previous, current=current))
@@ -135,6 +142,7 @@ class SceneManager:
             self.top.scene.on_exit({"next": name})
         item = _StackItem(name=name, scene=self.scenes[name], payload=payload)
         self._stack.append(item)
+        self._sync_top()
         item.scene.on_enter(payload)
 
     def _replace_stack_with(self, name: str, payload: dict | None) -> None:
@@ -144,8 +152,20 @@ class SceneManager:
     def _pop_all(self) -> None:
         while self._stack:
             item = self._stack.pop()
+            self._sync_top()
             item.scene.on_exit({"reason": "stack_clear"})
 
+    def _sync_top(self) -> None:
+        """Cache the top scene's per-frame entry points; call after every stack change."""
+        if self._stack:
+            scene = self._stack[-1].scene
+            self._top_handle_event = scene.handle_event
+            self._top_handle_input = scene.handle_input
+            self._top_update = scene.update
+            self._top_draw = scene.draw
+        else:
+            self._top_handle_event = self._top_handle_input = self._top_update = self._top_draw = _noop
+
     @property
     def top(self) -> _StackItem:
         return self._stack[-1]
@@ -161,13 +181,12 @@ class SceneManager:
         return None
 
     def handle_event(self, event: pygame.event.Event) -> None:
-        if self._stack:
+        if self._debug and self._stack:
             self.log.debug("Handle event", extra={"scene": self.current_name, "event": event.type})
-            self.top.scene.handle_event(event)
+        self._top_handle_event(event)
 
     def handle_input(self, input_state) -> None:
-        if self._stack:
-            self.top.scene.handle_input(input_state)
+        self._top_handle_input(input_state)
 
     def handle_game_event(self, event) -> None:
         if self._stack and hasattr(self.top.scene, "on_event"):
@@ -177,10 +196,9 @@ class SceneManager:
                 self.log.exception("Scene event handler failed", extra={"scene": self.current_name, "event": type(event).__name__})
 
     def update(self, dt: float) -> None:
-        if self._stack:
+        if self._debug and self._stack:
             self.log.debug("Update scene", extra={"scene": self.current_name, "dt": dt})
-            self.top.scene.update(dt)
+        self._top_update(dt)
 
     def draw(self, screen: pygame.Surface) -> None:
-        if self._stack:
-            self.top.scene.draw(screen)
+        self._top_draw(screen)
@@ -1,17 +1,57 @@
 from __future__ import annotations
 
+import os
 import pygame
 import logging
+from functools import partial
 from pathlib import Path
 
 from .base import Scene, SceneManager
 from ..ui.api import button_column, ButtonSpec
-from ..ui.widgets import ItemTile
+from ..ui.widgets import ItemTile, POINTER_EVENTS, draw_buttons, render_text
 from ..ui.layout import grid
 from pong.core.input import Action
 
 logger = logging.getLogger(__name__)
 
+# (path, size) -> scaled thumbnail; shared across tab switches and scene re-entries
+_THUMB_CACHE: dict[tuple[str, tuple[int, int]], pygame.Surface] = {}
+
+
+def _load_thumb(path: str, size: tuple[int, int]) -> pygame.Surface | None:
+    key = (path, size)
+    surf = _THUMB_CACHE.get(key)
+    if surf is not None:
+        return surf
+    if not Path(path).is_file():
+        return None
+    try:
+        raw = pygame.image.load(path)
+        # JPEGs carry no alpha; an opaque surface takes SDL's faster blit path
+        raw = raw.convert() if path.lower().endswith((".jpg", ".jpeg")) else raw.convert_alpha()
+        surf = pygame.transform.smoothscale(raw, size)
+    except Exception:
+        return None
+    _THUMB_CACHE[key] = surf
+    return surf
+
+
+# folder -> (mtime_ns, image files); one stat per build instead of one per file
+_DIR_CACHE: dict[Path, tuple[int, list[Path]]] = {}
+
+
+def _list_images(base: Path) -> list[Path]:
+    try:
+        mtime = os.stat(base).st_mtime_ns
+    except OSError:
+        return []
+    cached = _DIR_CACHE.get(base)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    files = [p for p in sorted(base.iterdir()) if p.is_file() and p.suffix.lower() in {".png", ".jpg", ".jpeg"}]
+    _DIR_CACHE[base] = (mtime, files)
+    return files
+
 
 class InventoryScene(Scene):
     def __init__(self, manager: SceneManager, font, font_small, theme) -> None:
@@ -20,12 +60,17 @@ class InventoryScene(Scene):
         self.font_small = font_small
         self.theme = theme
         self.categories = []
+        self._cats_by_id: dict[str, dict] = {}
         self.selected_cat_idx = 0
         self.selected_item_id: str | None = None
         self.items_grid: list[ItemTile] = []
+        self.current_items: list[dict] = []
+        self._items_by_id: dict[str, dict] = {}
         self.buttons: list = []
         self.status_msg = ""
-        self._rebuild_from_ctx()
+        # static background/title layer, see _build_chrome
+        self._chrome: pygame.Surface | None = None
+        # widgets and thumbnails are built on first enter, not at registration
 
     def on_enter(self, payload: dict | None = None) -> None:
         self.status_msg = ""
@@ -36,6 +81,7 @@ class InventoryScene(Scene):
         inv = self.manager.app_ctx.get("inventory", {}) if hasattr(self.manager, "app_ctx") else {}
         cats = inv.get("categories", []) if isinstance(inv, dict) else []
         self.categories = cats if cats else []
+        self._cats_by_id = {c.get("id"): c for c in self.categories}
         if self.selected_cat_idx >= len(self.categories):
             self.selected_cat_idx = 0
         self._build_buttons()
@@ -49,7 +95,7 @@ class InventoryScene(Scene):
         for i, c in enumerate(self.categories):
             rect = pygame.Rect(40 + i * (tab_w + spacing), 80, tab_w, tab_h)
             self.buttons.append(button_column(anchor=(rect.x, rect.y), width=tab_w, item_height=tab_h, spacing=0,
-                                              specs=[ButtonSpec(c.get("label", c.get("id", "Cat")), action=lambda idx=i: self._set_category(idx))],
+                                              specs=[ButtonSpec(c.get("label", c.get("id", "Cat")), action=partial(self._set_category, i))],
                                               font=self.font_small, theme=self.theme)[0])
         apply_rect = pygame.Rect(40, 420, 160, 44)
         back_rect = pygame.Rect(220, 420, 160, 44)
@@ -79,17 +125,12 @@ class InventoryScene(Scene):
         cell_h = 120
         spacing = (20, 32)
         positions = grid(anchor=(40, 150), cell=(cell_w, cell_h), cols=cols, spacing=spacing, count=len(items))
+        # owned ids for this category, resolved once for the whole grid
+        owned_set = self.manager.app_ctx.get("owned_items", {}).get(cat_id, set()) if hasattr(self.manager, "app_ctx") else set()
         for pos, item in zip(positions, items):
             rect = pygame.Rect(pos[0], pos[1], cell_w, cell_h)
-            surf = None
             sprite = item.get("path")
-            if sprite and Path(sprite).is_file():
-                try:
-                    raw = pygame.image.load(sprite).convert_alpha()
-                    surf = pygame.transform.smoothscale(raw, (cell_w - 16, cell_h - 16))
-                except Exception:
-                    surf = None
-            owned_set = self.manager.app_ctx.get("owned_items", {}).get(cat_id, set()) if hasattr(self.manager, "app_ctx") else set()
+            surf = _load_thumb(sprite, (cell_w - 16, cell_h - 16)) if sprite else None
             locked = item.get("id") not in owned_set
             self.items_grid.append(
                 ItemTile(
@@ -104,14 +145,16 @@ class InventoryScene(Scene):
                 )
             )
         self.current_items = items
-        if self.selected_item_id and self.selected_item_id not in {i.get("id") for i in items}:
+        # id -> item for O(1) lookups on click/apply
+        self._items_by_id = {i.get("id"): i for i in items}
+        if self.selected_item_id and self.selected_item_id not in self._items_by_id:
             self.selected_item_id = None
         logger.info("Inventory items built", extra={"category": cat_id, "count": len(items)})
 
     def _discover_items(self, cat_id: str, default_price: int) -> list[dict]:
         # Prefer explicit items provided by inventory.json; fall back to folder discovery.
         items: list[dict] = []
-        cat = next((c for c in self.categories if c.get("id") == cat_id), None)
+        cat = self._cats_by_id.get(cat_id)
         if cat:
             for itm in cat.get("items", []):
                 path = itm.get("path")
@@ -127,20 +170,19 @@ class InventoryScene(Scene):
         if items:
             return items
 
-        base = Path("skins") / cat_id
-        if base.exists():
-            for p in sorted(base.iterdir()):
-                if p.is_file() and p.suffix.lower() in {".png", ".jpg", ".jpeg"}:
-                    items.append({
-                        "id": p.stem,
-                        "name": p.stem.replace("_", " ").title(),
-                        "path": str(p),
-                        "price": default_price,
-                        "rarity": "common",
-                    })
+        for p in _list_images(Path("skins") / cat_id):
+            items.append({
+                "id": p.stem,
+                "name": p.stem.replace("_", " ").title(),
+                "path": str(p),
+                "price": default_price,
+                "rarity": "common",
+            })
         return items
 
     def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type not in POINTER_EVENTS:
+            return
         for b in self.buttons:
             b.handle_event(event)
         for tile in self.items_grid:
@@ -165,20 +207,26 @@ class InventoryScene(Scene):
         for tile in self.items_grid:
             tile.update(dt)
 
+    def _build_chrome(self, size: tuple[int, int]) -> None:
+        """Pre-compose background and heading; rebuilt on size change."""
+        chrome = pygame.Surface(size)
+        chrome.fill((18, 18, 26))
+        chrome.blit(render_text(self.font, "Inventory", (230, 230, 230)), (40, 30))
+        self._chrome = chrome.convert() if pygame.display.get_surface() else chrome
+
     def draw(self, screen: pygame.Surface) -> None:
-        screen.fill((18, 18, 26))
-        title = self.font.render("Inventory", True, (230, 230, 230))
-        screen.blit(title, (40, 30))
+        if self._chrome is None or self._chrome.get_size() != screen.get_size():
+            self._build_chrome(screen.get_size())
+        screen.blit(self._chrome, (0, 0))
         if self.categories:
             cat_label = self.categories[self.selected_cat_idx].get("label", "")
-            cat_txt = self.font_small.render(cat_label, True, (200, 220, 240))
+            cat_txt = render_text(self.font_small, cat_label, (200, 220, 240))
             screen.blit(cat_txt, (40, 110))
-        for b in self.buttons:
-            b.draw(screen)
+        draw_buttons(screen, self.buttons)
         for tile in self.items_grid:
             tile.draw(screen, self.font_small, selected=tile.item_id == self.selected_item_id)
         if self.status_msg:
-            msg = self.font_small.render(self.status_msg, True, (200, 220, 255))
+            msg = render_text(self.font_small, self.status_msg, (200, 220, 255))
             screen.blit(msg, (40, 470))
 
     def _select_item_by_id(self, item_id: str) -> None:
@@ -186,7 +234,7 @@ class InventoryScene(Scene):
             return
         cat_id = self.categories[self.selected_cat_idx].get("id")
         owned = self.manager.app_ctx.get("owned_items", {}).get(cat_id, set()) if hasattr(self.manager, "app_ctx") else set()
-        item = next((i for i in self.current_items if i.get("id") == item_id), None)
+        item = self._items_by_id.get(item_id)
         if not item:
             return
         price = item.get("price", 0)
@@ -218,7 +266,7 @@ class InventoryScene(Scene):
         cat_id = self.categories[self.selected_cat_idx].get("id")
         if not self.current_items:
             return
-        item = next((i for i in self.current_items if i.get("id") == self.selected_item_id), None)
+        item = self._items_by_id.get(self.selected_item_id)
         if not item:
             item = self.current_items[0]
         app = getattr(self.manager, "app", None)
@@ -5,6 +5,8 @@ import logging
 
 from .base import Scene, SceneManager
 from ..ui.api import button_column, ButtonSpec
+from ..ui.widgets import POINTER_EVENTS, draw_buttons, render_text
+from pong.events import ResolutionChanged
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,7 @@ class PauseScene(Scene):
         self.font = font
         self.font_small = font_small
         self.theme = theme
+        self._overlay: pygame.Surface | None = None
         self._build_buttons()
 
     def _resume(self) -> None:
@@ -54,11 +57,12 @@ class PauseScene(Scene):
         )
 
     def on_event(self, event) -> None:
-        from pong.events import ResolutionChanged
         if isinstance(event, ResolutionChanged):
             return
 
     def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type not in POINTER_EVENTS:
+            return
         for b in self.buttons:
             b.handle_event(event)
 
@@ -67,10 +71,14 @@ class PauseScene(Scene):
             b.update(dt)
 
     def draw(self, screen: pygame.Surface) -> None:
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
+        overlay = self._overlay
+        if overlay is None or overlay.get_size() != screen.get_size():
+            # opaque surface + surface alpha blends like the old SRCALPHA fill
+            overlay = pygame.Surface(screen.get_size())
+            overlay.fill((0, 0, 0))
+            overlay.set_alpha(150)
+            self._overlay = overlay
         screen.blit(overlay, (0, 0))
-        title = self.font.render("Paused", True, (255, 255, 255))
+        title = render_text(self.font, "Paused", (255, 255, 255))
         screen.blit(title, (60, 120))
-        for b in self.buttons:
-            b.draw(screen)
+        draw_buttons(screen, self.buttons)
@@ -10,9 +10,11 @@ try:
 except ImportError:  # fallback when run as script
     from pong.scenes.base import Scene, SceneManager
 from pong.core.input import Action
-from pong.events import BallBouncePaddle, BallBounceWall, PointScored, RoundReset
+from pong.events import BallBouncePaddle, BallBounceWall, PointScored, ResolutionChanged, RoundReset
 from pong.effects.base import EffectContext
 from pong.effects.manager import EffectManager
+from pong.physics import aabb_overlap, offset_angle, paddle_bounce
+from pong.ui.widgets import render_text
 
 logger = logging.getLogger(__name__)
 
@@ -55,10 +57,33 @@ class PlayScene(Scene):
         self.managers = {}
         self._init_effects()
         self.equipped_boost_id: str | None = None
+        # pre-rendered paddle/ball sprites, rebuilt when skin images or palette change
+        self._sprite_src: tuple | None = None
+        self._sprite_cache: dict[tuple, pygame.Surface] = {}
+        self._play_mask: pygame.Surface | None = None
+        self._colors: tuple | None = None
+        self._colors_palette = None
+        self._pending_events: list = []
+        # set while another scene (pause) is pushed on top; resuming keeps the match
+        self._suspended = False
+        # HUD text surfaces, re-rendered only when _hud_key changes
+        self._hud_key: tuple | None = None
+        self._hud: tuple = ()
 
     def on_enter(self, payload=None) -> None:
+        if self._suspended:
+            self._suspended = False
+            return
+        self.reset()
+
+    def on_exit(self, payload=None) -> None:
+        self._suspended = bool(payload and "next" in payload)
+
+    def reset(self) -> None:
+        """Start a new match in place, reusing sprites, caches and effect managers."""
         self.left_score = 0
         self.right_score = 0
+        self._pending_events.clear()
         self._center_ball(direction=1)
         # select first boost, but do not activate yet
         boosts = self.managers.get("boosts")
@@ -78,6 +103,7 @@ class PlayScene(Scene):
         self._update_ball(dt)
         self._update_paddles(dt)
         self._handle_boost_input()
+        self._flush_events()
 
     # Rendering layers --------------------------------------------------- #
     def draw(self, screen: pygame.Surface) -> None:
@@ -88,69 +114,122 @@ class PlayScene(Scene):
 
     def _draw_background(self, screen: pygame.Surface) -> None:
         ctx = self.manager.app_ctx if hasattr(self.manager, "app_ctx") else {}
-        palette = ctx.get("palette")
         bg_image = ctx.get("bg_image")
         if bg_image:
             screen.blit(bg_image, (0, 0))
         else:
-            bg = (12, 16, 26) if not palette else _hex_to_rgb(palette.background)
-            screen.fill(bg)
+            screen.fill(self._palette_colors(ctx.get("palette"))[0])
         # mask play area so bar is distinct (optional darken)
-        play_rect = pygame.Rect(0, self.play_top, self.width, self.play_height)
-        mask = pygame.Surface((self.width, self.play_height), pygame.SRCALPHA)
-        mask.fill((0, 0, 0, 40))
-        screen.blit(mask, play_rect.topleft)
+        mask = self._play_mask
+        if mask is None or mask.get_size() != (self.width, self.play_height):
+            mask = pygame.Surface((self.width, self.play_height), pygame.SRCALPHA)
+            mask.fill((0, 0, 0, 40))
+            mask = mask.convert_alpha()
+            self._play_mask = mask
+        screen.blit(mask, (0, self.play_top))
 
     def _draw_world(self, screen: pygame.Surface) -> None:
         ctx = self.manager.app_ctx if hasattr(self.manager, "app_ctx") else {}
-        palette = ctx.get("palette")
-        accent = (90, 140, 255) if not palette else _hex_to_rgb(palette.accent)
+        accent = self._palette_colors(ctx.get("palette"))[1]
 
+        self._sync_sprite_sources(ctx.get("paddle_image"), ctx.get("ball_image"), accent)
+        blits = []
         # paddles
-        ball_img = ctx.get("ball_image")
-        paddle_img = ctx.get("paddle_image")
         for key in ("left", "right"):
             p = self.paddles[key]
-            rect = pygame.Rect(int(p["x"]), int(p["y"]), p["w"], p["h"])
-            if paddle_img:
-                scaled = pygame.transform.smoothscale(paddle_img, rect.size)
-                screen.blit(scaled, rect)
-            else:
-                pygame.draw.rect(screen, accent, rect, border_radius=4)
+            blits.append((self._paddle_surface(p["w"], p["h"]), (int(p["x"]), int(p["y"]))))
 
         # ball
         b = self.ball
-        brect = pygame.Rect(int(b["x"]), int(b["y"]), b["size"], b["size"])
-        if ball_img:
-            scaled_ball = pygame.transform.smoothscale(ball_img, brect.size)
-            rotated = pygame.transform.rotate(scaled_ball, b.get("angle", 0.0))
-            rrect = rotated.get_rect(center=brect.center)
-            screen.blit(rotated, rrect)
+        size = b["size"]
+        if self._sprite_src[1]:
+            rotated = self._rotated_ball(size, b.get("angle", 0.0))
+            center = (int(b["x"]) + size // 2, int(b["y"]) + size // 2)
+            blits.append((rotated, rotated.get_rect(center=center)))
         else:
-            pygame.draw.ellipse(screen, accent, brect)
+            blits.append((self._ball_surface(size), (int(b["x"]), int(b["y"]))))
+        screen.blits(blits, doreturn=False)
+
+    def _palette_colors(self, palette) -> tuple:
+        """(background, world accent, ui foreground, ui accent), resolved once per palette."""
+        if self._colors is None or palette is not self._colors_palette:
+            if palette:
+                accent = _hex_to_rgb(palette.accent)
+                self._colors = (_hex_to_rgb(palette.background), accent, _hex_to_rgb(palette.foreground), accent)
+            else:
+                self._colors = ((12, 16, 26), (90, 140, 255), (240, 220, 180), (120, 180, 255))
+            self._colors_palette = palette
+        return self._colors
+
+    def _sync_sprite_sources(self, paddle_img, ball_img, accent) -> None:
+        """Drop cached entity sprites when skin images or palette change."""
+        src = (paddle_img, ball_img, accent)
+        if src != self._sprite_src:
+            self._sprite_src = src
+            self._sprite_cache.clear()
+
+    def _paddle_surface(self, w: int, h: int) -> pygame.Surface:
+        key = ("paddle", w, h)
+        surf = self._sprite_cache.get(key)
+        if surf is None:
+            paddle_img, _, accent = self._sprite_src
+            if paddle_img:
+                surf = pygame.transform.smoothscale(paddle_img, (w, h))
+            else:
+                surf = pygame.Surface((w, h), pygame.SRCALPHA)
+                pygame.draw.rect(surf, accent, surf.get_rect(), border_radius=4)
+            surf = surf.convert_alpha()
+            self._sprite_cache[key] = surf
+        return surf
+
+    def _ball_surface(self, size: int) -> pygame.Surface:
+        key = ("ball", size)
+        surf = self._sprite_cache.get(key)
+        if surf is None:
+            _, ball_img, accent = self._sprite_src
+            if ball_img:
+                surf = pygame.transform.smoothscale(ball_img, (size, size))
+            else:
+                surf = pygame.Surface((size, size), pygame.SRCALPHA)
+                pygame.draw.ellipse(surf, accent, surf.get_rect())
+            surf = surf.convert_alpha()
+            self._sprite_cache[key] = surf
+        return surf
+
+    def _rotated_ball(self, size: int, angle: float) -> pygame.Surface:
+        """Rotated ball sprite, built lazily once per whole degree and reused every turn."""
+        key = ("ball_rot", size, int(angle) % 360)
+        surf = self._sprite_cache.get(key)
+        if surf is None:
+            surf = pygame.transform.rotate(self._ball_surface(size), key[2])
+            self._sprite_cache[key] = surf
+        return surf
 
     def _draw_ui(self, screen: pygame.Surface) -> None:
         palette = self.manager.app_ctx.get("palette") if hasattr(self.manager, "app_ctx") else None
-        fg = (240, 220, 180) if not palette else _hex_to_rgb(palette.foreground)
-        accent = (120, 180, 255) if not palette else _hex_to_rgb(palette.accent)
+        _, _, fg, accent = self._palette_colors(palette)
         # top bar background
         bar_height = 64
         pygame.draw.rect(screen, (20, 24, 32), pygame.Rect(0, 0, screen.get_width(), bar_height))
         pygame.draw.line(screen, accent, (0, bar_height), (screen.get_width(), bar_height), width=2)
-        # scores centered
-        score_txt = f"{self.left_score}   |   {self.right_score}"
-        score = self.font.render(score_txt, True, fg)
-        screen.blit(score, (screen.get_width() // 2 - score.get_width() // 2, 14))
-        # equipped boost
-        boost_label = "Boost: "
-        if self.equipped_boost_id:
-            boost_label += self.equipped_boost_id
-        else:
-            boost_label += "None"
-        boost_txt = self.font_small.render(boost_label, True, accent)
-        screen.blit(boost_txt, (40, 20))
-        hint = self.font_small.render("[Esc/P] Pause   [Space] Boost", True, fg)
-        screen.blit(hint, (screen.get_width() - hint.get_width() - 40, 20))
+        # score, equipped boost and hint only re-render when their inputs change
+        key = (self.left_score, self.right_score, self.equipped_boost_id, fg, accent)
+        if key != self._hud_key:
+            self._hud_key = key
+            self._hud = (
+                self.font.render(f"{self.left_score}   |   {self.right_score}", True, fg).convert_alpha(),
+                self.font_small.render(f"Boost: {self.equipped_boost_id or 'None'}", True, accent).convert_alpha(),
+                render_text(self.font_small, "[Esc/P] Pause   [Space] Boost", fg),
+            )
+        score, boost_txt, hint = self._hud
+        screen.blits(
+            (
+                (score, (screen.get_width() // 2 - score.get_width() // 2, 14)),
+                (boost_txt, (40, 20)),
+                (hint, (screen.get_width() - hint.get_width() - 40, 20)),
+            ),
+            doreturn=False,
+        )
 
     def _draw_effect_overlays(self, screen: pygame.Surface) -> None:
         boosts = self.managers.get("boosts")
@@ -160,7 +239,7 @@ class PlayScene(Scene):
             draw = getattr(eff, "draw_overlay", None)
             if draw:
                 try:
-                    draw(EffectContext(app=self.manager.app, play_scene=self, bus=self.manager.app.bus, logger=logger, rng=random.Random()), screen)
+                    draw(boosts.ctx, screen)
                 except Exception:
                     logger.exception("Effect overlay draw failed", extra={"id": getattr(eff, 'id', '?')})
 
@@ -168,9 +247,10 @@ class PlayScene(Scene):
         boosts = self.managers.get("boosts")
         if not boosts:
             return None
-        for eff in boosts.active.values():
-            if getattr(eff, "active", False) and getattr(eff, "id", "") == "shield_once":
-                return eff
+        # active effects are keyed by id, so this is a single lookup per frame
+        eff = boosts.active.get("shield_once")
+        if eff is not None and getattr(eff, "active", False):
+            return eff
         return None
 
     def _update_ball(self, dt: float) -> None:
@@ -185,7 +265,7 @@ class PlayScene(Scene):
         if b["y"] <= top:
             b["y"] = top
             b["vy"] *= -1
-            b["vx"], b["vy"] = _offset_angle(b["vx"], b["vy"], 8.0 if b["vx"] >= 0 else -8.0)
+            b["vx"], b["vy"] = offset_angle(b["vx"], b["vy"], 8.0 if b["vx"] >= 0 else -8.0)
             b["spin"] *= 0.9
             ang = math.degrees(math.atan2(b["vy"], b["vx"]))
             self._emit(
@@ -202,7 +282,7 @@ class PlayScene(Scene):
         if b["y"] + size >= bottom:
             b["y"] = bottom - size
             b["vy"] *= -1
-            b["vx"], b["vy"] = _offset_angle(b["vx"], b["vy"], -8.0 if b["vx"] >= 0 else 8.0)
+            b["vx"], b["vy"] = offset_angle(b["vx"], b["vy"], -8.0 if b["vx"] >= 0 else 8.0)
             b["spin"] *= 0.9
             ang = math.degrees(math.atan2(b["vy"], b["vx"]))
             self._emit(
@@ -219,25 +299,13 @@ class PlayScene(Scene):
         # paddle collisions
         for key in ("left", "right"):
             p = self.paddles[key]
-            rect = pygame.Rect(int(p["x"]), int(p["y"]), p["w"], p["h"])
-            brect = pygame.Rect(int(b["x"]), int(b["y"]), size, size)
-            if rect.colliderect(brect):
-                hit_pos = (brect.centery - rect.centery) / (p["h"] / 2)
+            px, py, pw, ph = int(p["x"]), int(p["y"]), p["w"], p["h"]
+            bx, by = int(b["x"]), int(b["y"])
+            if aabb_overlap(bx, by, size, size, px, py, pw, ph):
+                hit_pos = ((by + size // 2) - (py + ph // 2)) / (ph / 2)
                 hit_pos = max(-1.0, min(1.0, hit_pos))
-                speed = max(320.0, (abs(b["vx"]) + abs(b["vy"])) * 0.55)
                 dir_x = 1 if key == "left" else -1
-                new_vx = dir_x * speed
-                new_vy = hit_pos * speed * 0.75
-                # keep total speed consistent
-                mag = (new_vx ** 2 + new_vy ** 2) ** 0.5
-                target = max(340.0, mag)
-                new_vx = new_vx / mag * target
-                new_vy = new_vy / mag * target
-                # apply fixed deflection so bounce isn't perfectly mirrored
-                deflect = 10.0
-                if hit_pos < 0:
-                    deflect = -deflect
-                b["vx"], b["vy"] = _offset_angle(new_vx, new_vy, deflect)
+                b["vx"], b["vy"], target = paddle_bounce(b["vx"], b["vy"], hit_pos, dir_x)
                 b["spin"] = hit_pos * 720.0
                 # nudge out of paddle to avoid sticking
                 if key == "left":
@@ -276,37 +344,44 @@ class PlayScene(Scene):
 
     def _update_paddles(self, dt: float) -> None:
         # simple follow ball AI for right; left player via keyboard
+        left = self.paddles["left"]
+        right = self.paddles["right"]
         input_state = self.manager.app.input if hasattr(self.manager, "app") else None
-        if input_state and input_state.is_held(Action.UP):
-            self.paddles["left"]["y"] -= self.paddles["left"]["speed"] * dt
-        if input_state and input_state.is_held(Action.DOWN):
-            self.paddles["left"]["y"] += self.paddles["left"]["speed"] * dt
+        if input_state:
+            held = input_state.held
+            direction = (Action.DOWN in held) - (Action.UP in held)
+            left["y"] += direction * left["speed"] * dt
         # clamp
         top = self.play_top
         bottom = self.play_bottom
-        for key in ("left", "right"):
-            p = self.paddles[key]
-            p["y"] = max(top, min(bottom - p["h"], p["y"]))
+        left["y"] = max(top, min(bottom - left["h"], left["y"]))
+        right["y"] = max(top, min(bottom - right["h"], right["y"]))
         # simple AI right
         b = self.ball
-        target = b["y"] - self.paddles["right"]["h"] / 2
         if b["vx"] > 0:
-            if self.paddles["right"]["y"] + self.paddles["right"]["h"] / 2 < target:
-                self.paddles["right"]["y"] += self.paddles["right"]["speed"] * dt
-            elif self.paddles["right"]["y"] > target:
-                self.paddles["right"]["y"] -= self.paddles["right"]["speed"] * dt
+            ry = right["y"]
+            target = b["y"] - right["h"] / 2
+            # +1 below target, -1 above it, 0 inside the dead zone (both can't hold at once)
+            right["y"] = ry + ((ry + right["h"] / 2 < target) - (ry > target)) * right["speed"] * dt
 
     def on_event(self, event) -> None:
-        from pong.events import ResolutionChanged
         if isinstance(event, ResolutionChanged):
             return  # resolution fixed; ignore
         for m in self.managers.values():
             m.on_event(event)
 
     def _emit(self, event) -> None:
+        # queued during the physics step and published together by _flush_events
+        self._pending_events.append(event)
+
+    def _flush_events(self) -> None:
+        if not self._pending_events:
+            return
+        events = self._pending_events
+        self._pending_events = []
         app = getattr(self.manager, "app", None)
         if app and hasattr(app, "bus"):
-            app.bus.publish(event)
+            app.bus.publish_batch(events)
 
     # Effects ----------------------------------------------------------- #
     def _init_effects(self) -> None:
@@ -322,13 +397,16 @@ class PlayScene(Scene):
 
     def _center_ball(self, direction: int = 1) -> None:
         """Place ball in center; direction 1 -> to right, -1 -> to left."""
-        self.ball["x"] = self.width / 2 - self.ball["size"] / 2
-        self.ball["y"] = self.play_top + self.play_height / 2 - self.ball["size"] / 2
+        half = self.ball["size"] / 2
         speed = 320.0
-        self.ball["vx"] = speed * direction
-        self.ball["vy"] = 120.0 * (-1 if direction < 0 else 1)
-        self.ball["spin"] = 80.0 * direction
-        self.ball["angle"] = 0.0
+        self.ball.update(
+            x=self.width / 2 - half,
+            y=self.play_top + self.play_height / 2 - half,
+            vx=speed * direction,
+            vy=120.0 * (-1 if direction < 0 else 1),
+            spin=80.0 * direction,
+            angle=0.0,
+        )
 
     def _score_point(self, scorer: str) -> None:
         if scorer == "left":
@@ -365,13 +443,3 @@ def _hex_to_rgb(hexstr: str) -> tuple[int, int, int]:
     if len(hs) == 3:
         hs = "".join([c * 2 for c in hs])
     return tuple(int(hs[i : i + 2], 16) for i in (0, 2, 4))
-
-
-def _offset_angle(vx: float, vy: float, deg: float) -> tuple[float, float]:
-    """Rotate velocity vector by deg while preserving speed."""
-    speed = math.hypot(vx, vy)
-    if speed == 0:
-        return vx, vy
-    ang = math.atan2(vy, vx)
-    ang += math.radians(deg)
-    return math.cos(ang) * speed, math.sin(ang) * speed
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import pygame
 import logging
+from functools import partial
 
 from .base import Scene, SceneManager
 from ..ui.api import button_column, ButtonSpec
-from ..ui.widgets import Button
+from ..ui.widgets import Button, POINTER_EVENTS, draw_buttons, render_text
 from pong.core.input import Action, default_action_keys
 
 logger = logging.getLogger(__name__)
@@ -61,7 +62,7 @@ class SettingsScene(Scene):
             keyname = "-" if keycode is None or keycode < 0 else pygame.key.name(keycode)
             label = f"{act}: {keyname}"
             rect = pygame.Rect(anchor_x, anchor_y + i * (h + spacing), w, h)
-            self.binding_buttons.append(Button(rect, label, self.font_small, on_click=lambda a=act: self._start_listen(a), variant="primary", theme=self.theme))
+            self.binding_buttons.append(Button(rect, label, self.font_small, on_click=partial(self._start_listen, act), variant="primary", theme=self.theme))
 
     def _build_misc_buttons(self):
         w, h = 200, 48
@@ -106,6 +107,8 @@ class SettingsScene(Scene):
         if self.listening_for and event.type == pygame.KEYDOWN:
             self._finish_rebind(event.key)
             return
+        if event.type not in POINTER_EVENTS:
+            return
         for b in self.binding_buttons:
             b.handle_event(event)
         for b in self.buttons:
@@ -144,17 +147,15 @@ class SettingsScene(Scene):
     # drawing ----------------------------------------------------------- #
     def draw(self, screen: pygame.Surface) -> None:
         screen.fill((16, 20, 28))
-        title = self.font.render("Settings", True, (230, 230, 230))
+        title = render_text(self.font, "Settings", (230, 230, 230))
         screen.blit(title, (40, 40))
-        subtitle = self.font_small.render("Keybinds", True, (200, 210, 220))
+        subtitle = render_text(self.font_small, "Keybinds", (200, 210, 220))
         screen.blit(subtitle, (40, 100))
 
-        for b in self.binding_buttons:
-            b.draw(screen)
+        draw_buttons(screen, self.binding_buttons)
 
-        for b in self.buttons:
-            b.draw(screen)
+        draw_buttons(screen, self.buttons)
 
         if self.status:
-            msg = self.font_small.render(self.status, True, (210, 220, 255))
+            msg = render_text(self.font_small, self.status, (210, 220, 255))
             screen.blit(msg, (40, 360))
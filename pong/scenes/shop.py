@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import pygame
 import logging
+from functools import partial
 
 from .base import Scene, SceneManager
 from ..ui.api import button_column, ButtonSpec
+from ..ui.widgets import POINTER_EVENTS, draw_buttons, render_text
 from pong.core.input import Action
 
 logger = logging.getLogger(__name__)
@@ -17,13 +19,17 @@ class ShopScene(Scene):
         self.font_small = font_small
         self.theme = theme
         self.status_msg = ""
+        # static background/title layer, see _build_chrome
+        self._chrome: pygame.Surface | None = None
+        self._chrome_palette = None
+        self._fg = (240, 200, 120)
         self.packages = [
             {"label": "Buy 1000C for 9.999€ (Satire)", "credits": 1000},
             {"label": "Buy 5000C for 49.999€ (Satire)", "credits": 5000},
         ]
         specs = [
-            ButtonSpec("1000C Pack", action=lambda: self._buy_pack(0)),
-            ButtonSpec("5000C Pack", action=lambda: self._buy_pack(1)),
+            ButtonSpec("1000C Pack", action=partial(self._buy_pack, 0)),
+            ButtonSpec("5000C Pack", action=partial(self._buy_pack, 1)),
             ButtonSpec("Back", action=self._back, variant="ghost"),
         ]
         self.buttons = button_column(
@@ -38,6 +44,8 @@ class ShopScene(Scene):
         )
 
     def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type not in POINTER_EVENTS:
+            return
         for b in self.buttons:
             b.handle_event(event)
 
@@ -61,23 +69,30 @@ class ShopScene(Scene):
         for b in self.buttons:
             b.update(dt)
 
-    def draw(self, screen: pygame.Surface) -> None:
-        palette = self.manager.app_ctx.get("palette") if hasattr(self.manager, "app_ctx") else None
+    def _build_chrome(self, size: tuple[int, int], palette) -> None:
+        """Pre-compose background, title and subtitle; rebuilt on palette or size change."""
         bg = (14, 14, 24) if not palette else _hex_to_rgb(palette.background)
         fg = (240, 200, 120) if not palette else _hex_to_rgb(palette.foreground)
-        screen.fill(bg)
-        title = self.font.render("Satire Shop", True, fg)
-        screen.blit(title, (40, 40))
+        chrome = pygame.Surface(size)
+        chrome.fill(bg)
+        chrome.blit(render_text(self.font, "Satire Shop", fg), (40, 40))
+        chrome.blit(render_text(self.font_small, "Kaufe mehr Credits", fg), (40, 140))
+        self._chrome = chrome.convert() if pygame.display.get_surface() else chrome
+        self._chrome_palette = palette
+        self._fg = fg
+
+    def draw(self, screen: pygame.Surface) -> None:
+        palette = self.manager.app_ctx.get("palette") if hasattr(self.manager, "app_ctx") else None
+        if self._chrome is None or palette is not self._chrome_palette or self._chrome.get_size() != screen.get_size():
+            self._build_chrome(screen.get_size(), palette)
+        screen.blit(self._chrome, (0, 0))
         credits = self.manager.app_ctx.get("credits", 0)
-        credits_txt = self.font_small.render(f"Credits: {credits}", True, fg)
+        credits_txt = render_text(self.font_small, f"Credits: {credits}", self._fg)
         screen.blit(credits_txt, (40, 100))
-        subtitle = self.font_small.render("Kaufe mehr Credits", True, fg)
-        screen.blit(subtitle, (40, 140))
         if self.status_msg:
-            msg = self.font_small.render(self.status_msg, True, (255, 210, 180))
+            msg = render_text(self.font_small, self.status_msg, (255, 210, 180))
             screen.blit(msg, (40, 180))
-        for b in self.buttons:
-            b.draw(screen)
+        draw_buttons(screen, self.buttons)
 
     def _buy_pack(self, idx: int) -> None:
         if idx < 0 or idx >= len(self.packages):
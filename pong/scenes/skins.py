@@ -5,7 +5,7 @@ import logging
 
 from .base import Scene, SceneManager
 from ..ui.api import button_column, ButtonSpec
-from ..ui.widgets import Label
+from ..ui.widgets import Label, POINTER_EVENTS, draw_buttons, render_text
 from ..ui.focus import FocusManager, FocusItem
 from pong.core.input import Action
 
@@ -56,6 +56,8 @@ class SkinsScene(Scene):
         logger.info("SkinsScene enter", extra={"skins": self._skin_list})
 
     def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type not in POINTER_EVENTS:
+            return
         for b in self.buttons:
             b.handle_event(event)
 
@@ -80,17 +82,17 @@ class SkinsScene(Scene):
         palette = self.manager.app_ctx.get("palette") if hasattr(self.manager, "app_ctx") else None
         bg = (12, 16, 22) if not palette else _hex_to_rgb(palette.background)
         screen.fill(bg)
-        title = self.font.render("Skins", True, (240, 240, 255))
+        title = render_text(self.font, "Skins", (240, 240, 255))
         screen.blit(title, (40, 40))
 
         credits = self.manager.app_ctx.get("credits", 0)
-        credits_txt = self.font_small.render(f"Credits: {credits}", True, (220, 230, 240))
+        credits_txt = render_text(self.font_small, f"Credits: {credits}", (220, 230, 240))
         screen.blit(credits_txt, (40, 70))
 
         skin_name = self._skin_list[self._selected_idx] if self._skin_list else "none"
         owned = skin_name in self._owned
         info = f"Selected: {skin_name} ({'Owned' if owned else 'Not owned'})"
-        info_txt = self.font_small.render(info, True, (220, 230, 240))
+        info_txt = render_text(self.font_small, info, (220, 230, 240))
         screen.blit(info_txt, (40, 100))
 
         # Palette preview
@@ -103,11 +105,10 @@ class SkinsScene(Scene):
             pygame.draw.rect(screen, c, pygame.Rect(40 + i * 64, 160, 60, 60), border_radius=8)
 
         if self.status_msg:
-            msg = self.font_small.render(self.status_msg, True, (255, 210, 180))
+            msg = render_text(self.font_small, self.status_msg, (255, 210, 180))
             screen.blit(msg, (40, 240))
 
-        for b in self.buttons:
-            b.draw(screen)
+        draw_buttons(screen, self.buttons)
 
     def _apply_selected(self) -> None:
         if not self._skin_list:
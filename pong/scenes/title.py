@@ -5,8 +5,10 @@ import logging
 
 from .base import Scene, SceneManager
 from ..ui.api import button_column, ButtonSpec
+from ..ui.widgets import POINTER_EVENTS, draw_buttons, render_text
 from ..ui.focus import FocusManager, FocusItem
 from pong.core.input import Action
+from pong.events import ResolutionChanged
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +19,9 @@ class TitleScene(Scene):
         self.font_big = font_big
         self.font_small = font_small
         self.theme = theme
+        # static background/title layer, see _build_chrome
+        self._chrome: pygame.Surface | None = None
+        self._chrome_palette = None
         self._build_buttons(screen_rect)
 
     def _build_buttons(self, screen_rect: pygame.Rect) -> None:
@@ -65,7 +70,6 @@ class TitleScene(Scene):
         self.focus.set_items(items)
 
     def on_event(self, event) -> None:
-        from pong.events import ResolutionChanged
         if isinstance(event, ResolutionChanged):
             return
 
@@ -78,6 +82,8 @@ class TitleScene(Scene):
         logger.info("Exit requested from Title")
 
     def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type not in POINTER_EVENTS:
+            return
         for b in self.buttons:
             b.handle_event(event)
 
@@ -95,20 +101,28 @@ class TitleScene(Scene):
         for b in self.buttons:
             b.update(dt)
 
-    def draw(self, screen: pygame.Surface) -> None:
-        palette = self.manager.app_ctx.get("palette") if hasattr(self.manager, "app_ctx") else None
+    def _build_chrome(self, size: tuple[int, int], palette) -> None:
+        """Pre-compose background, title and subtitle; rebuilt on palette or size change."""
         bg = (10, 14, 22) if not palette else _hex_to_rgb(palette.background)
         fg = (255, 200, 120) if not palette else _hex_to_rgb(palette.accent)
         text_fg = (255, 255, 255) if not palette else _hex_to_rgb(palette.foreground)
+        chrome = pygame.Surface(size)
+        chrome.fill(bg)
+        title = render_text(self.font_big, "BATTLE PONG", fg)
+        chrome.blit(title, (size[0] // 2 - title.get_width() // 2, 100))
+        subtitle = render_text(self.font_small, "Backbone Preview", text_fg)
+        chrome.blit(subtitle, (size[0] // 2 - subtitle.get_width() // 2, 160))
+        self._chrome = chrome.convert() if pygame.display.get_surface() else chrome
+        self._chrome_palette = palette
 
-        screen.fill(bg)
-        title = self.font_big.render("BATTLE PONG", True, fg)
-        screen.blit(title, (screen.get_width() // 2 - title.get_width() // 2, 100))
-        subtitle = self.font_small.render("Backbone Preview", True, text_fg)
-        screen.blit(subtitle, (screen.get_width() // 2 - subtitle.get_width() // 2, 160))
-        for b in self.buttons:
-            b.draw(screen)
-        logger.debug("Title draw")
+    def draw(self, screen: pygame.Surface) -> None:
+        palette = self.manager.app_ctx.get("palette") if hasattr(self.manager, "app_ctx") else None
+        if self._chrome is None or palette is not self._chrome_palette or self._chrome.get_size() != screen.get_size():
+            self._build_chrome(screen.get_size(), palette)
+        screen.blit(self._chrome, (0, 0))
+        draw_buttons(screen, self.buttons)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Title draw")
 
 
 def _hex_to_rgb(hexstr: str) -> tuple[int, int, int]:
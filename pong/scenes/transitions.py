@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from typing import Callable, Optional
 import pygame
 
-from ..ui.tween import tween
+from ..ui.tween import PRESETS, ease_linear
 
 
 @dataclass
@@ -33,11 +33,18 @@ class TransitionController:
         self.spec = TransitionSpec()
         self._time = 0.0
         self._on_complete: Optional[Callable[[], None]] = None
+        # resolved once per start() instead of string-matching every frame
+        self._ease: Callable[[float], float] = ease_linear
+        self._drawer: Optional[Callable[["TransitionController", pygame.Surface, float], None]] = None
+        self._overlay: Optional[pygame.Surface] = None
 
     def start(self, spec: TransitionSpec, on_complete: Callable[[], None]) -> None:
         self.spec = spec
         self._time = 0.0
         self._on_complete = on_complete
+        self._ease = PRESETS.get(spec.easing, ease_linear)
+        self._drawer = self._DRAWERS.get(spec.name)
+        self._overlay = None
         self.active = spec.duration > 0
         if not self.active:
             on_complete()
@@ -57,18 +64,25 @@ class TransitionController:
         return min(1.0, self._time / self.spec.duration)
 
     def draw_overlay(self, screen: pygame.Surface) -> None:
-        if not self.active:
+        # instant or unknown: no drawer, no overlay
+        if not self.active or self._drawer is None:
             return
-        p = tween(self.progress(), self.spec.easing)
-        if self.spec.name == "fade":
-            overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-            alpha = int(255 * p)
-            overlay.fill((*self.spec.color, alpha))
-            screen.blit(overlay, (0, 0))
-        elif self.spec.name == "slide_left":
-            width = int(screen.get_width() * p)
-            rect = pygame.Rect(0, 0, width, screen.get_height())
-            overlay = pygame.Surface((width, screen.get_height()))
+        self._drawer(self, screen, self._ease(self.progress()))
+
+    def _draw_fade(self, screen: pygame.Surface, p: float) -> None:
+        overlay = self._overlay
+        if overlay is None or overlay.get_size() != screen.get_size():
+            overlay = pygame.Surface(screen.get_size())
             overlay.fill(self.spec.color)
-            screen.blit(overlay, rect)
-        # instant or unknown: no overlay
+            self._overlay = overlay
+        overlay.set_alpha(int(255 * p))
+        screen.blit(overlay, (0, 0))
+
+    def _draw_slide_left(self, screen: pygame.Surface, p: float) -> None:
+        width = int(screen.get_width() * p)
+        screen.fill(self.spec.color, pygame.Rect(0, 0, width, screen.get_height()))
+
+    _DRAWERS: dict[str, Callable[["TransitionController", pygame.Surface, float], None]] = {
+        "fade": _draw_fade,
+        "slide_left": _draw_slide_left,
+    }
@@ -6,14 +6,15 @@ Other systems can request changes via events and the game will apply them.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplaySettings:
     width: int = 960
     height: int = 540
@@ -21,7 +22,7 @@ class DisplaySettings:
     fps: int = 60
 
 
-@dataclass
+@dataclass(slots=True)
 class PaddleSettings:
     width: int = 16
     height: int = 110
@@ -29,7 +30,7 @@ class PaddleSettings:
     margin_x: int = 32
 
 
-@dataclass
+@dataclass(slots=True)
 class BallSettings:
     size: int = 16
     speed: float = 300.0
@@ -38,7 +39,7 @@ class BallSettings:
     max_speed: float = 380.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SpriteSettings:
     """Paths to optional sprite assets."""
 
@@ -49,17 +50,17 @@ class SpriteSettings:
     tile_background: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TrailSettings:
     effect: str = "trail_none"
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchSettings:
     win_score: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class RuntimeSettings:
     display: DisplaySettings = field(default_factory=DisplaySettings)
     paddle: PaddleSettings = field(default_factory=PaddleSettings)
@@ -70,16 +71,24 @@ class RuntimeSettings:
 
     def patch(self, section: str, **values: Any) -> Dict[str, Any]:
         """Update values on one settings section and return the applied changes."""
-        target = getattr(self, section, None)
-        if target is None:
+        if section not in _field_names(RuntimeSettings):
             raise ValueError(f"Unknown settings section '{section}'")
-        logger.debug("Settings patch requested", extra={"section": section, "values": values})
+        target = getattr(self, section)
+        names = _field_names(type(target))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Settings patch requested", extra={"section": section, "values": values})
 
         applied: Dict[str, Any] = {}
         for key, value in values.items():
-            if not hasattr(target, key):
+            if key not in names:
                 raise ValueError(f"Unknown field '{key}' for section '{section}'")
             setattr(target, key, value)
             applied[key] = value
         logger.info("Settings patched", extra={"section": section, "values": applied})
         return applied
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> frozenset[str]:
+    """Field names of a settings dataclass, computed once per class."""
+    return frozenset(f.name for f in fields(cls))
@@ -1,4 +1,4 @@
-from .widgets import Button, Label, Toggle, Slider, ThemeTokens, ButtonStyle, DEFAULT_THEME
+from .widgets import Button, Label, Toggle, Slider, ThemeTokens, ButtonStyle, DEFAULT_THEME, POINTER_EVENTS, draw_buttons, render_text, sysfont
 from .api import button_column, button_row, ButtonSpec
 from .tween import tween, PRESETS
 from .layout import column, row, grid
@@ -12,6 +12,10 @@ __all__ = [
     "ThemeTokens",
     "ButtonStyle",
     "DEFAULT_THEME",
+    "POINTER_EVENTS",
+    "render_text",
+    "sysfont",
+    "draw_buttons",
     "button_column",
     "button_row",
     "ButtonSpec",
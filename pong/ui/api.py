@@ -7,12 +7,17 @@ custom callbacks. Keeps layout math and styling in one place.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 from typing import Callable, Iterable, Sequence
 import pygame
 
 from .widgets import Button, DEFAULT_THEME
 
 
+def _noop() -> None:
+    return
+
+
 @dataclass
 class ButtonSpec:
     label: str
@@ -47,9 +52,9 @@ def button_column(
         if spec.action:
             action = spec.action
         elif on_route and spec.route:
-            action = lambda r=spec.route: on_route(r)
+            action = partial(on_route, spec.route)
         else:
-            action = lambda: None
+            action = _noop
         buttons.append(Button(rect, spec.label, font, action, variant=spec.variant, theme=theme))
     return buttons
 
@@ -73,8 +78,8 @@ def button_row(
         if spec.action:
             action = spec.action
         elif on_route and spec.route:
-            action = lambda r=spec.route: on_route(r)
+            action = partial(on_route, spec.route)
         else:
-            action = lambda: None
+            action = _noop
         buttons.append(Button(rect, spec.label, font, action, variant=spec.variant, theme=theme))
     return buttons
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 import pygame
 import logging
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# the only event types widgets react to; scenes skip dispatch for everything else
+_MOUSEMOTION, _MOUSEBUTTONDOWN, _MOUSEBUTTONUP = pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP
+POINTER_EVENTS = frozenset((_MOUSEMOTION, _MOUSEBUTTONDOWN, _MOUSEBUTTONUP))
+
 
 # --- Theme & helpers ------------------------------------------------------ #
 
@@ -29,6 +34,19 @@ class ThemeTokens:
         return self.variants.get(variant, self.variants["primary"])
 
 
+@functools.lru_cache(maxsize=32)
+def sysfont(name: str, size: int, bold: bool = False) -> pygame.font.Font:
+    """SysFont lookup is a font-directory scan plus FreeType load; share instances."""
+    return pygame.font.SysFont(name, size, bold=bold)
+
+
+@functools.lru_cache(maxsize=128)
+def render_text(font: pygame.font.Font, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+    """Render text once per (font, text, color); callers must not draw onto the result."""
+    surf = font.render(text, True, color)
+    return surf.convert_alpha() if pygame.display.get_surface() else surf
+
+
 def _lerp(a: float, b: float, t: float) -> float:
     return a + (b - a) * max(0.0, min(1.0, t))
 
@@ -85,12 +103,13 @@ class Button:
 
     # Interaction --------------------------------------------------------- #
     def handle_event(self, event: pygame.event.Event) -> None:
-        if event.type == pygame.MOUSEMOTION:
+        etype = event.type
+        if etype == _MOUSEMOTION:
             self.hovered = self.rect.collidepoint(event.pos)
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        elif etype == _MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(event.pos):
                 self.pressed = True
-        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+        elif etype == _MOUSEBUTTONUP and event.button == 1:
             if self.pressed and self.rect.collidepoint(event.pos):
                 self.on_click()
                 logger.debug("Button click", extra={"label": self.label})
@@ -105,6 +124,10 @@ class Button:
 
     # Drawing ------------------------------------------------------------- #
     def draw(self, screen: pygame.Surface) -> None:
+        self.draw_chrome(screen)
+        screen.blit(*self.label_blit())
+
+    def draw_chrome(self, screen: pygame.Surface) -> None:
         style = self.theme.resolve(self.variant)
         # Blend between hover/press/base
         col_hover = _lerp_color(style.base, style.hover, self._hover_t)
@@ -112,15 +135,33 @@ class Button:
         pygame.draw.rect(screen, col_press, self.rect, border_radius=style.radius)
         border_w = 4 if self.focused else 2
         pygame.draw.rect(screen, style.border, self.rect, width=border_w, border_radius=style.radius)
-        text = self.font.render(self.label, True, style.text)
-        text_rect = text.get_rect(center=self.rect.center)
-        screen.blit(text, text_rect)
-        logger.debug("Button draw", extra={"label": self.label, "hover": self._hover_t, "press": self._press_t})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Button draw", extra={"label": self.label, "hover": self._hover_t, "press": self._press_t})
+
+    def label_blit(self) -> tuple[pygame.Surface, pygame.Rect]:
+        """(surface, dest) for the label, suitable for Surface.blits."""
+        text = render_text(self.font, self.label, self.theme.resolve(self.variant).text)
+        return text, text.get_rect(center=self.rect.center)
 
     def set_focus(self, focused: bool) -> None:
         self.focused = focused
 
 
+def draw_buttons(screen: pygame.Surface, buttons: list[Button]) -> None:
+    """Draw button backgrounds, then every label in one blits call (buttons must not overlap)."""
+    for b in buttons:
+        b.draw_chrome(screen)
+    screen.blits([b.label_blit() for b in buttons], doreturn=False)
+
+
+@functools.lru_cache(maxsize=8)
+def _lock_overlay(size: tuple[int, int]) -> pygame.Surface:
+    """Dimming layer for locked tiles; one shared surface per tile size."""
+    overlay = pygame.Surface(size, pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, 140))
+    return overlay.convert_alpha() if pygame.display.get_surface() else overlay
+
+
 class ItemTile:
     def __init__(
         self,
@@ -144,9 +185,10 @@ class ItemTile:
         self.rarity = rarity
 
     def handle_event(self, event: pygame.event.Event) -> None:
-        if event.type == pygame.MOUSEMOTION:
+        etype = event.type
+        if etype == _MOUSEMOTION:
             self.hovered = self.rect.collidepoint(event.pos)
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        elif etype == _MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(event.pos):
                 self.on_click(self.item_id)
 
@@ -164,20 +206,19 @@ class ItemTile:
         if self.image:
             img_rect = self.image.get_rect(center=self.rect.center)
             screen.blit(self.image, img_rect.topleft)
-        label_surf = font.render(self.label, True, (230, 230, 230))
+        label_surf = render_text(font, self.label, (230, 230, 230))
         label_rect = label_surf.get_rect(center=(self.rect.centerx, self.rect.bottom + 12))
         screen.blit(label_surf, label_rect)
         if self.locked:
-            overlay = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 140))
-            screen.blit(overlay, self.rect.topleft)
-            lock_txt = font.render(f"{self.price}C", True, (255, 210, 180))
+            screen.blit(_lock_overlay(self.rect.size), self.rect.topleft)
+            lock_txt = render_text(font, f"{self.price}C", (255, 210, 180))
             lock_rect = lock_txt.get_rect(center=self.rect.center)
             screen.blit(lock_txt, lock_rect)
-        rarity_txt = font.render(self.rarity.title(), True, (210, 200, 255))
+        rarity_txt = render_text(font, self.rarity.title(), (210, 200, 255))
         rarity_rect = rarity_txt.get_rect(midtop=(self.rect.centerx, self.rect.top - 16))
         screen.blit(rarity_txt, rarity_rect)
-        logger.debug("ItemTile draw", extra={"id": self.item_id, "locked": self.locked, "selected": selected})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ItemTile draw", extra={"id": self.item_id, "locked": self.locked, "selected": selected})
 
 class Label:
     def __init__(self, text: str, pos: tuple[int, int], font: pygame.font.Font, color=(230, 230, 230)) -> None:
@@ -185,11 +226,18 @@ class Label:
         self.pos = pos
         self.font = font
         self.color = color
+        self._img: pygame.Surface | None = None
+        self._img_key: tuple | None = None
 
     def draw(self, screen: pygame.Surface) -> None:
-        img = self.font.render(self.text, True, self.color)
-        screen.blit(img, self.pos)
-        logger.debug("Label draw", extra={"text": self.text})
+        # re-render only when text/color/font were reassigned
+        key = (self.text, self.color, self.font)
+        if key != self._img_key:
+            self._img = self.font.render(self.text, True, self.color)
+            self._img_key = key
+        screen.blit(self._img, self.pos)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Label draw", extra={"text": self.text})
 
 
 class Toggle:
@@ -202,9 +250,10 @@ class Toggle:
         self.hovered = False
 
     def handle_event(self, event: pygame.event.Event) -> None:
-        if event.type == pygame.MOUSEMOTION:
+        etype = event.type
+        if etype == _MOUSEMOTION:
             self.hovered = self.rect.collidepoint(event.pos)
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        elif etype == _MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(event.pos):
                 self.value = not self.value
                 self.on_change(self.value)
@@ -222,7 +271,7 @@ class Toggle:
         knob_rect = pygame.Rect(knob_x, self.rect.top + 3, knob_size, knob_size)
         pygame.draw.ellipse(screen, (240, 240, 255), knob_rect)
         if self.label:
-            text = self.font.render(self.label, True, (220, 230, 240))
+            text = render_text(self.font, self.label, (220, 230, 240))
             screen.blit(text, (self.rect.right + 12, self.rect.centery - text.get_height() // 2))
 
 
@@ -0,0 +1,18 @@
+import unittest
+from pathlib import Path
+
+from pong.effects.loader import load_effects
+
+EFFECTS_DIR = Path(__file__).resolve().parent.parent / "pong" / "effects"
+
+
+class LoadEffectsTest(unittest.TestCase):
+    def test_every_plugin_directory_loads(self) -> None:
+        for category in ("modifiers", "chaos", "boosts"):
+            with self.subTest(category=category):
+                effects = load_effects(str(EFFECTS_DIR / category))
+                self.assertTrue(effects, f"no effects loaded from {category}")
+
+
+if __name__ == "__main__":
+    unittest.main()